@@ -6,7 +6,7 @@ echo ""
 # Check if running on Arch-based system
 if ! command -v pacman &> /dev/null; then
     echo "Warning: This installer is designed for Arch-based systems (CachyOS, Manjaro, etc.)"
-    echo "You may need to manually install: PyQt6, PyQt6-Charts, PyQt6-WebEngine, and python-psutil"
+    echo "You may need to manually install: PyQt6, PyQt6-WebEngine, and python-psutil"
     echo ""
 fi
 
@@ -20,10 +20,6 @@ if ! python -c "import PyQt6" 2>/dev/null; then
     packages_to_install+=("python-pyqt6")
 fi
 
-if ! python -c "from PyQt6.QtCharts import QChart" 2>/dev/null; then
-    packages_to_install+=("python-pyqt6-charts")
-fi
-
 if ! python -c "from PyQt6.QtWebEngineWidgets import QWebEngineView" 2>/dev/null; then
     packages_to_install+=("python-pyqt6-webengine")
 fi
@@ -52,13 +48,6 @@ else
     echo "✓ PyQt6 installed"
 fi
 
-if ! python -c "from PyQt6.QtCharts import QChart" 2>/dev/null; then
-    echo "✗ PyQt6-Charts installation failed"
-    all_ok=false
-else
-    echo "✓ PyQt6-Charts installed"
-fi
-
 if ! python -c "from PyQt6.QtWebEngineWidgets import QWebEngineView" 2>/dev/null; then
     echo "✗ PyQt6-WebEngine installation failed"
     all_ok=false
@@ -77,7 +66,7 @@ echo ""
 
 if [ "$all_ok" = false ]; then
     echo "Some dependencies failed to install. Please install manually:"
-    echo "  sudo pacman -S python-pyqt6 python-pyqt6-charts python-pyqt6-webengine python-psutil"
+    echo "  sudo pacman -S python-pyqt6 python-pyqt6-webengine python-psutil"
     exit 1
 fi
 
@@ -6,25 +6,81 @@ with real-time monitoring, graphs, and enhanced UX
 """
 
 import sys
-import subprocess
 import os
+import re
 import psutil
 import time
 from pathlib import Path
 from datetime import datetime
 from collections import deque
+from functools import partial
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QScrollArea, QMessageBox,
+    QPushButton, QLabel, QPlainTextEdit, QScrollArea, QMessageBox,
     QTabWidget, QGridLayout, QFrame, QProgressBar, QGroupBox
 )
-from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal, QUrl
-from PyQt6.QtGui import QFont, QTextCursor, QPalette, QColor, QIcon
-from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
-from PyQt6.QtWebEngineWidgets import QWebEngineView
+from PyQt6.QtCore import QTimer, Qt, QObject, QProcess, pyqtSignal, QUrl, QPointF, QRectF
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPainter, QPen, QPolygonF, QDesktopServices
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 
 
-class PgAdminManager(QThread):
+# pgAdmin announces its local server URL on stdout once it is ready
+_URL_RE = re.compile(rb'http://(?:127\.0\.0\.1|localhost)\S+')
+
+# Systemd units managed by the dashboard and the pkexec scripts that start/stop
+# them (stopped in reverse order)
+SYSTEMD_SERVICES = ('mongodb', 'postgresql', 'meilisearch', 'ollama')
+_START_CMD = ' && '.join(f'systemctl start {s}' for s in SYSTEMD_SERVICES)
+_STOP_CMD = ' && '.join(f'systemctl stop {s}' for s in reversed(SYSTEMD_SERVICES))
+
+
+def get_listen_map():
+    """Map listening TCP ports to their connection in a single socket scan"""
+    try:
+        return {c.laddr.port: c for c in psutil.net_connections(kind='tcp')
+                if c.status == 'LISTEN'}
+    except:
+        return {}
+
+
+def get_listening_ports():
+    """Return the set of local TCP ports in LISTEN state, read from /proc/net"""
+    ports = set()
+    for path in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(path) as f:
+                next(f)  # Header
+                for line in f:
+                    fields = line.split()
+                    if fields[3] == '0A':  # TCP_LISTEN
+                        ports.add(int(fields[1].rsplit(':', 1)[1], 16))
+        except OSError:
+            pass
+    return ports
+
+
+def connect_unique(signal, slot):
+    """Connect signal to slot unless that exact connection already exists"""
+    try:
+        signal.connect(slot, Qt.ConnectionType.UniqueConnection)
+    except TypeError:
+        pass  # Qt refuses the duplicate; the existing connection stays
+
+
+def format_uptime(seconds):
+    """Format a duration in seconds as a short uptime string"""
+    minutes = max(int(seconds), 0) // 60
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days > 0:
+        return f"{days}d {hours}h"
+    elif hours > 0:
+        return f"{hours}h {minutes}m"
+    else:
+        return f"{minutes}m"
+
+
+class PgAdminManager(QObject):
     """Manage pgAdmin4 process"""
     status_updated = pyqtSignal(bool, str)  # is_running, url
     output_ready = pyqtSignal(str)
@@ -34,8 +90,10 @@ class PgAdminManager(QThread):
         self.process = None
         self.running = False
         self.pgadmin_url = None
+        self._line_buffer = b''
+        self._url_found = False
     
-    def run(self):
+    def start(self):
         """Start pgAdmin4"""
         pgadmin_path = Path.home() / '.local' / 'src' / 'pgadmin'
         venv_python = pgadmin_path / 'bin' / 'python'
@@ -47,194 +105,277 @@ class PgAdminManager(QThread):
             self.status_updated.emit(False, "")
             return
         
-        try:
-            self.process = subprocess.Popen(
-                [str(pgadmin_script)],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                cwd=str(pgadmin_path)
-            )
-            
-            self.running = True
-            
-            # Wait for pgAdmin to start and find the URL
-            for line in self.process.stdout:
-                self.output_ready.emit(line)
-                
-                # Look for the server URL in output
-                if 'http' in line.lower() and ('127.0.0.1' in line or 'localhost' in line):
-                    # Extract URL from line
-                    import re
-                    url_match = re.search(r'http://[^\s]+', line)
-                    if url_match:
-                        self.pgadmin_url = url_match.group(0).rstrip('/')
-                    else:
-                        self.pgadmin_url = "http://127.0.0.1:5050"
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self.process.setWorkingDirectory(str(pgadmin_path))
+        self.process.readyReadStandardOutput.connect(self.read_output)
+        self.process.finished.connect(self.on_finished)
+        self.process.errorOccurred.connect(self.on_error)
+        
+        self.running = True
+        self._line_buffer = b''
+        self._url_found = False
+        self.process.start(str(pgadmin_script), [])
+    
+    def read_output(self):
+        """Forward pgAdmin output and watch it for the server URL"""
+        data = bytes(self.process.readAllStandardOutput())
+        self.output_ready.emit(data.decode(errors='replace'))
+        
+        if self._url_found:
+            return
+        
+        # Only scan complete lines; keep the trailing partial line for next time
+        lines = (self._line_buffer + data).split(b'\n')
+        self._line_buffer = lines.pop()
+        
+        for line in lines:
+            # Look for the server URL in output
+            if b'http' in line:
+                url_match = _URL_RE.search(line)
+                if url_match:
+                    self.pgadmin_url = url_match.group(0).decode().rstrip('/')
+                    self._url_found = True
+                    self._line_buffer = b''
                     self.status_updated.emit(True, self.pgadmin_url)
-                
-                if not self.running:
                     break
-            
-            self.process.wait()
-            self.running = False
-            self.status_updated.emit(False, "")
-            
-        except Exception as e:
-            self.output_ready.emit(f"Error starting pgAdmin: {str(e)}\n")
+    
+    def on_finished(self, exit_code, exit_status):
+        self.running = False
+        self.status_updated.emit(False, "")
+    
+    def on_error(self, error):
+        if error == QProcess.ProcessError.FailedToStart:
+            self.output_ready.emit(f"Error starting pgAdmin: {self.process.errorString()}\n")
             self.running = False
             self.status_updated.emit(False, "")
     
+    def is_running(self):
+        return self.process is not None and self.process.state() != QProcess.ProcessState.NotRunning
+    
     def stop(self):
         """Stop pgAdmin4"""
         self.running = False
-        if self.process:
+        if self.is_running():
             self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            if not self.process.waitForFinished(5000):
                 self.process.kill()
+                self.process.waitForFinished()
 
 
-class SystemMonitor(QThread):
-    """Monitor system-wide resources"""
+class MonitorController(QObject):
+    """Monitor system resources, services and processes from the Qt event loop"""
     stats_updated = pyqtSignal(dict)
+    status_updated = pyqtSignal(str, dict)  # service_name, status_dict
+    logs_ready = pyqtSignal(str, str)  # service_name, logs
+    
+    MANUAL_SERVICES = [('librechat', 3080, 'node'), ('rag_api', 8000, 'uvicorn')]
     
     def __init__(self):
         super().__init__()
-        self.running = True
-        self.history_size = 60  # Keep 60 data points (1 minute at 1s intervals)
-        self.cpu_history = deque(maxlen=self.history_size)
-        self.ram_history = deque(maxlen=self.history_size)
-    
-    def run(self):
-        while self.running:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            ram = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+        self.previous_status = {}
+        self.service_stats = {}
+        self._systemd_cache = {}
+        self._systemctl = None
+        self._proc_cache = {}
+        self._active_pids = set()
+        self._start_times = {}
+        self._last_stats = {}
+        self._listener_pids = {}
+        self._tick_count = 0
+        self._disk = None
+        self._meminfo_fd = open('/proc/meminfo', 'rb')
+        
+        # Prime the counter so the first non-blocking sample has a baseline
+        psutil.cpu_percent(interval=None)
+        
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+    
+    def start(self):
+        self.timer.start(1000)
+        self.tick()
+    
+    def tick(self):
+        """Sample system stats every tick and services every other tick"""
+        self.update_system_stats()
+        if self._tick_count % 2 == 0:
+            self.update_services()
+        self._tick_count += 1
+    
+    def update_system_stats(self):
+        cpu_percent = psutil.cpu_percent(interval=None)
+        ram_total, ram_available = self.read_meminfo()
+        ram_used = ram_total - ram_available
+        ram_percent = ram_used / ram_total * 100 if ram_total else 0
+        
+        # Disk usage barely moves, so only statvfs every 30 ticks
+        if self._disk is None or self._tick_count % 30 == 0:
+            self._disk = psutil.disk_usage('/')
+        disk = self._disk
+        
+        stats = {
+            'cpu_percent': cpu_percent,
+            'ram_percent': ram_percent,
+            'ram_used_gb': ram_used / (1024**3),
+            'ram_total_gb': ram_total / (1024**3),
+            'disk_percent': disk.percent,
+            'disk_used_gb': disk.used / (1024**3),
+            'disk_total_gb': disk.total / (1024**3)
+        }
+        
+        self.stats_updated.emit(stats)
+    
+    def read_meminfo(self):
+        """Return (total, available) RAM in bytes from the kept-open /proc/meminfo"""
+        self._meminfo_fd.seek(0)
+        data = self._meminfo_fd.read()
+        total = int(data.partition(b'MemTotal:')[2].split(None, 1)[0])
+        available = int(data.partition(b'MemAvailable:')[2].split(None, 1)[0])
+        return total * 1024, available * 1024
+    
+    def update_services(self):
+        # Forget processes that no longer back any service
+        for pid in list(self._proc_cache):
+            if pid not in self._active_pids:
+                del self._proc_cache[pid]
+        self._active_pids = set()
+        
+        # Systemd services are reported once the async systemctl call returns
+        self.refresh_systemd_states()
+        
+        # Check manual processes. Finding a socket's owner walks every
+        # process's fds, so only do that when a port is listening and the
+        # process last seen on it has died
+        listening = get_listening_ports()
+        listen_map = None
+        for name, port, cmd_filter in self.MANUAL_SERVICES:
+            pid = None
+            if port in listening:
+                pid = self._listener_pids.get(name)
+                if pid is None or not psutil.pid_exists(pid):
+                    if listen_map is None:
+                        listen_map = get_listen_map()
+                    conn = listen_map.get(port)
+                    pid = conn.pid if conn else None
+            self._listener_pids[name] = pid
             
-            self.cpu_history.append(cpu_percent)
-            self.ram_history.append(ram.percent)
+            stats = self.check_process(name, pid, cmd_filter)
+            self.emit_if_changed(name, stats)
+    
+    def update_systemd_services(self):
+        for service in SYSTEMD_SERVICES:
+            state = self._systemd_cache.get(service, {})
+            status = state.get('status', 'unknown')
+            pid = state.get('pid')
+            start_time = state.get('start_time')
             
             stats = {
-                'cpu_percent': cpu_percent,
-                'ram_percent': ram.percent,
-                'ram_used_gb': ram.used / (1024**3),
-                'ram_total_gb': ram.total / (1024**3),
-                'disk_percent': disk.percent,
-                'disk_used_gb': disk.used / (1024**3),
-                'disk_total_gb': disk.total / (1024**3),
-                'cpu_history': list(self.cpu_history),
-                'ram_history': list(self.ram_history)
+                'status': status,
+                'is_running': (status == "active"),
+                'pid': pid,
+                'cpu_percent': 0,
+                'memory_mb': 0,
+                'uptime': format_uptime(time.time() - start_time) if status == "active" and start_time else "N/A"
             }
             
-            self.stats_updated.emit(stats)
-    
-    def stop(self):
-        self.running = False
-
-
-class ServiceMonitor(QThread):
-    """Monitor services and processes"""
-    status_updated = pyqtSignal(str, dict)  # service_name, status_dict
-    logs_ready = pyqtSignal(str, str)  # service_name, logs
-    
-    def __init__(self):
-        super().__init__()
-        self.running = True
-        self.previous_status = {}
-        self.service_stats = {}
-    
-    def run(self):
-        while self.running:
-            # Check systemd services
-            for service in ['mongodb', 'postgresql', 'meilisearch', 'ollama']:
-                status = self.check_systemd_service(service)
-                pid = self.get_service_pid(service)
-                
-                stats = {
-                    'status': status,
-                    'is_running': (status == "active"),
-                    'pid': pid,
-                    'cpu_percent': 0,
-                    'memory_mb': 0,
-                    'uptime': self.get_service_uptime(service) if status == "active" else "N/A"
-                }
-                
-                # If service just became active, fetch logs
-                if status == "active" and self.previous_status.get(service) != "active":
-                    logs = self.get_systemd_logs(service, 10)
-                    self.logs_ready.emit(service, logs)
-                
-                self.previous_status[service] = status
-                
-                # Get process stats if running
-                if pid:
-                    try:
-                        proc = psutil.Process(pid)
-                        stats['cpu_percent'] = proc.cpu_percent(interval=0.1)
-                        stats['memory_mb'] = proc.memory_info().rss / (1024**2)
-                    except:
-                        pass
-                
-                self.status_updated.emit(service, stats)
+            # If service just became active, fetch logs
+            if status == "active" and self.previous_status.get(service) != "active":
+                self.fetch_systemd_logs(service, 10)
+            
+            self.previous_status[service] = status
             
-            # Check manual processes
-            for name, port, cmd_filter in [('librechat', 3080, 'node'), ('rag_api', 8000, 'uvicorn')]:
-                stats = self.check_process(name, port, cmd_filter)
-                self.status_updated.emit(name, stats)
+            # Get process stats if running
+            if pid:
+                try:
+                    proc = self._get_proc(pid)
+                    stats['cpu_percent'] = proc.cpu_percent(interval=None)
+                    stats['memory_mb'] = proc.memory_info().rss / (1024**2)
+                except:
+                    pass
             
-            self.msleep(2000)
+            self.emit_if_changed(service, stats)
+    
+    def emit_if_changed(self, name, stats):
+        """Emit status_updated only when the stats visibly changed since the last emit"""
+        last = self._last_stats.get(name)
+        if (last is not None
+                and all(last[key] == stats[key] for key in ('status', 'pid', 'uptime'))
+                and abs(last['cpu_percent'] - stats['cpu_percent']) < 0.1
+                and abs(last['memory_mb'] - stats['memory_mb']) < 0.1):
+            return
+        self._last_stats[name] = stats
+        self.status_updated.emit(name, stats)
+    
+    def _get_proc(self, pid):
+        """Return a cached psutil.Process for pid, priming its CPU counter on first use"""
+        self._active_pids.add(pid)
+        proc = self._proc_cache.get(pid)
+        if proc is None or not proc.is_running():
+            proc = psutil.Process(pid)
+            proc.cpu_percent(interval=None)
+            self._proc_cache[pid] = proc
+        return proc
+    
+    def refresh_systemd_states(self):
+        """Query state, PID and uptime of all services with a single async systemctl call"""
+        if self._systemctl:
+            if self._systemctl.state() != QProcess.ProcessState.NotRunning:
+                # Previous query is still hanging; replace it with a fresh one
+                self._systemctl.finished.disconnect()
+                self._systemctl.kill()
+            self._systemctl.deleteLater()
+        
+        self._systemctl = QProcess(self)
+        self._systemctl.finished.connect(self.on_systemd_states)
+        self._systemctl.start('systemctl', ['show', *SYSTEMD_SERVICES,
+                              '--property=ActiveState,MainPID,ActiveEnterTimestamp'])
+    
+    def on_systemd_states(self, exit_code, exit_status):
+        output = bytes(self._systemctl.readAllStandardOutput()).decode(errors='replace')
+        blocks = output.strip().split('\n\n')
+        
+        # systemctl prints one blank-line separated block per unit, in order
+        self._systemd_cache = {}
+        for service, block in zip(SYSTEMD_SERVICES, blocks):
+            props = {}
+            for line in block.splitlines():
+                key, _, value = line.partition('=')
+                props[key] = value
+            
+            try:
+                pid = int(props.get('MainPID', 0))
+            except ValueError:
+                pid = 0
+            
+            self._systemd_cache[service] = {
+                'status': props.get('ActiveState') or 'unknown',
+                'pid': pid if pid > 0 else None,
+                'start_time': self.parse_start_time(service, props.get('ActiveEnterTimestamp', ''))
+            }
+        
+        self.update_systemd_services()
     
-    def check_systemd_service(self, service):
-        try:
-            result = subprocess.run(
-                ['systemctl', 'is-active', service],
-                capture_output=True, text=True, timeout=2
-            )
-            return result.stdout.strip()
-        except:
-            return "unknown"
-    
-    def get_service_pid(self, service):
-        try:
-            result = subprocess.run(
-                ['systemctl', 'show', service, '--property=MainPID'],
-                capture_output=True, text=True, timeout=2
-            )
-            pid_str = result.stdout.strip().split('=')[1]
-            pid = int(pid_str)
-            return pid if pid > 0 else None
-        except:
-            return None
-    
-    def get_service_uptime(self, service):
+    def parse_start_time(self, service, timestamp_str):
+        """Convert an ActiveEnterTimestamp to epoch seconds, parsing each value only once"""
+        cached = self._start_times.get(service)
+        if cached and cached[0] == timestamp_str:
+            return cached[1]
+        
+        start_time = None
         try:
-            result = subprocess.run(
-                ['systemctl', 'show', service, '--property=ActiveEnterTimestamp'],
-                capture_output=True, text=True, timeout=2
-            )
-            timestamp_str = result.stdout.strip().split('=')[1]
-            if timestamp_str:
-                # Parse and calculate uptime
-                start_time = datetime.strptime(timestamp_str.split('.')[0], '%a %Y-%m-%d %H:%M:%S %Z')
-                uptime = datetime.now() - start_time
-                days = uptime.days
-                hours, remainder = divmod(uptime.seconds, 3600)
-                minutes, _ = divmod(remainder, 60)
-                
-                if days > 0:
-                    return f"{days}d {hours}h"
-                elif hours > 0:
-                    return f"{hours}h {minutes}m"
-                else:
-                    return f"{minutes}m"
-            return "N/A"
-        except:
-            return "N/A"
-    
-    def check_process(self, name, port, command_filter):
+            # e.g. "Wed 2024-01-10 12:34:56 CET" (local time)
+            _, date_str, clock_str = timestamp_str.split(' ')[:3]
+            year, month, day = map(int, date_str.split('-'))
+            hour, minute, second = map(int, clock_str.split('.')[0].split(':'))
+            start_time = datetime(year, month, day, hour, minute, second).timestamp()
+        except ValueError:
+            pass
+        
+        self._start_times[service] = (timestamp_str, start_time)
+        return start_time
+    
+    def check_process(self, name, pid, command_filter):
         stats = {
             'status': 'inactive',
             'is_running': False,
@@ -244,56 +385,49 @@ class ServiceMonitor(QThread):
             'uptime': 'N/A'
         }
         
-        try:
-            for conn in psutil.net_connections():
-                if conn.laddr.port == port and conn.status == 'LISTEN':
-                    try:
-                        proc = psutil.Process(conn.pid)
-                        cmdline = ' '.join(proc.cmdline())
-                        if command_filter.lower() in cmdline.lower():
-                            stats['status'] = 'active'
-                            stats['is_running'] = True
-                            stats['pid'] = conn.pid
-                            stats['cpu_percent'] = proc.cpu_percent(interval=0.1)
-                            stats['memory_mb'] = proc.memory_info().rss / (1024**2)
-                            
-                            # Calculate uptime
-                            create_time = datetime.fromtimestamp(proc.create_time())
-                            uptime = datetime.now() - create_time
-                            hours, remainder = divmod(uptime.seconds, 3600)
-                            minutes, _ = divmod(remainder, 60)
-                            if uptime.days > 0:
-                                stats['uptime'] = f"{uptime.days}d {hours}h"
-                            elif hours > 0:
-                                stats['uptime'] = f"{hours}h {minutes}m"
-                            else:
-                                stats['uptime'] = f"{minutes}m"
-                            break
-                    except:
-                        pass
-        except:
-            pass
+        if pid:
+            try:
+                proc = self._get_proc(pid)
+                cmdline = ' '.join(proc.cmdline())
+                if command_filter.lower() in cmdline.lower():
+                    stats['status'] = 'active'
+                    stats['is_running'] = True
+                    stats['pid'] = pid
+                    stats['cpu_percent'] = proc.cpu_percent(interval=None)
+                    stats['memory_mb'] = proc.memory_info().rss / (1024**2)
+                    
+                    stats['uptime'] = format_uptime(time.time() - proc.create_time())
+            except:
+                pass
         
         return stats
     
-    def get_systemd_logs(self, service, lines=10):
-        """Fetch recent logs from systemd journal"""
-        try:
-            result = subprocess.run(
-                ['journalctl', '-u', service, '-n', str(lines), '--no-pager'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            return result.stdout
-        except Exception as e:
-            return f"Could not fetch logs: {str(e)}\n"
+    def fetch_systemd_logs(self, service, lines=10):
+        """Fetch recent logs from systemd journal and emit them via logs_ready"""
+        proc = QProcess(self)
+        proc.finished.connect(partial(self.on_logs_finished, service, proc))
+        proc.errorOccurred.connect(partial(self.on_logs_error, service, proc))
+        proc.start('journalctl', ['-u', service, '-n', str(lines), '--no-pager'])
+    
+    def on_logs_finished(self, service, proc, exit_code, exit_status):
+        self.logs_ready.emit(service, bytes(proc.readAllStandardOutput()).decode(errors='replace'))
+        proc.deleteLater()
+    
+    def on_logs_error(self, service, proc, error):
+        # finished is never emitted when the process could not be started
+        if error == QProcess.ProcessError.FailedToStart:
+            self.logs_ready.emit(service, f"Could not fetch logs: {proc.errorString()}\n")
+            proc.deleteLater()
     
     def stop(self):
-        self.running = False
+        self.timer.stop()
+        self._meminfo_fd.close()
+        if self._systemctl and self._systemctl.state() != QProcess.ProcessState.NotRunning:
+            self._systemctl.kill()
+            self._systemctl.waitForFinished(1000)
 
 
-class ProcessRunner(QThread):
+class ProcessRunner(QObject):
     """Run processes and capture output"""
     output_ready = pyqtSignal(str)
     process_finished = pyqtSignal(int)
@@ -303,50 +437,69 @@ class ProcessRunner(QThread):
         super().__init__()
         self.command = command
         self.cwd = cwd
-        self.process = None
-    
-    def run(self):
-        try:
-            self.process = subprocess.Popen(
-                self.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                cwd=self.cwd,
-                bufsize=1
-            )
-            self.process_started.emit()
-            
-            for line in self.process.stdout:
-                self.output_ready.emit(line)
-            
-            self.process.wait()
-            self.process_finished.emit(self.process.returncode)
-        except Exception as e:
-            self.output_ready.emit(f"Error: {str(e)}\n")
+        self._line_buffer = b''
+        self.process = QProcess(self)
+        self.process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self.read_output)
+        self.process.started.connect(self.process_started)
+        self.process.finished.connect(self.on_finished)
+        self.process.errorOccurred.connect(self.on_error)
+    
+    def start(self):
+        if self.cwd:
+            self.process.setWorkingDirectory(str(self.cwd))
+        self.process.start(self.command[0], self.command[1:])
+    
+    def read_output(self):
+        """Emit every complete line read so far as one batch"""
+        data = self._line_buffer + bytes(self.process.readAllStandardOutput())
+        end = data.rfind(b'\n') + 1
+        self._line_buffer = data[end:]
+        if end:
+            self.output_ready.emit(data[:end].decode(errors='replace'))
+    
+    def on_finished(self, exit_code, exit_status):
+        if self._line_buffer:
+            self.output_ready.emit(self._line_buffer.decode(errors='replace') + '\n')
+            self._line_buffer = b''
+        self.process_finished.emit(exit_code)
+    
+    def on_error(self, error):
+        # finished is never emitted when the process could not be started
+        if error == QProcess.ProcessError.FailedToStart:
+            self.output_ready.emit(f"Error: {self.process.errorString()}\n")
             self.process_finished.emit(-1)
     
+    def is_running(self):
+        return self.process.state() != QProcess.ProcessState.NotRunning
+    
     def stop_process(self):
-        if self.process:
+        if self.is_running():
             self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            if not self.process.waitForFinished(5000):
                 self.process.kill()
+                self.process.waitForFinished()
 
 
 class ServiceCard(QFrame):
     """Individual service card widget"""
     
     log_signal = pyqtSignal(str)  # Signal for log output
+    running_changed = pyqtSignal(bool)  # Emitted when the monitor sees the service start/stop
+    
+    # Shared by all cards; the font is built on first use once QApplication exists
+    _TITLE_FONT = None
+    _DETAIL_STYLE = "color: #888888; font-size: 9px;"
     
     def __init__(self, name, display_name, is_systemd=True):
         super().__init__()
         self.name = name
         self.display_name = display_name
         self.is_systemd = is_systemd
-        self.process_thread = None
+        self.process_runner = None
         self.is_running = False
+        self._log_connected = False
+        self._state = "off"
         
         self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
         self.init_ui()
@@ -357,26 +510,28 @@ class ServiceCard(QFrame):
         # Header
         header = QHBoxLayout()
         title = QLabel(self.display_name)
-        title_font = QFont()
-        title_font.setPointSize(11)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        if ServiceCard._TITLE_FONT is None:
+            title_font = QFont()
+            title_font.setPointSize(11)
+            title_font.setBold(True)
+            ServiceCard._TITLE_FONT = title_font
+        title.setFont(ServiceCard._TITLE_FONT)
         header.addWidget(title)
         header.addStretch()
         
         self.status_indicator = QLabel("●")
-        self.status_indicator.setStyleSheet("font-size: 16px; color: #9E9E9E;")
+        self.status_indicator.setProperty('state', self._state)
         header.addWidget(self.status_indicator)
         
         layout.addLayout(header)
         
         # Stats
         self.stats_label = QLabel("Status: Stopped")
-        self.stats_label.setStyleSheet("color: #888888; font-size: 9px;")
+        self.stats_label.setStyleSheet(self._DETAIL_STYLE)
         layout.addWidget(self.stats_label)
         
         self.resource_label = QLabel("CPU: 0% | RAM: 0 MB")
-        self.resource_label.setStyleSheet("color: #888888; font-size: 9px;")
+        self.resource_label.setStyleSheet(self._DETAIL_STYLE)
         layout.addWidget(self.resource_label)
         
         # Buttons
@@ -412,25 +567,36 @@ class ServiceCard(QFrame):
         """Update service statistics"""
         is_running = stats.get('is_running', False)
         status = stats.get('status', 'unknown')
-        self.is_running = is_running
+        if is_running != self.is_running:
+            self.is_running = is_running
+            self.running_changed.emit(is_running)
         
-        # Update status indicator
+        # Update status indicator by switching the preloaded QSS state
         if is_running:
-            self.status_indicator.setStyleSheet("color: #4CAF50; font-size: 16px;")
+            state = "run"
         elif status == "failed":
-            self.status_indicator.setStyleSheet("color: #F44336; font-size: 16px;")
+            state = "fail"
         else:
-            self.status_indicator.setStyleSheet("color: #9E9E9E; font-size: 16px;")
+            state = "off"
+        if state != self._state:
+            self.status_indicator.setProperty('state', state)
+            self.status_indicator.style().unpolish(self.status_indicator)
+            self.status_indicator.style().polish(self.status_indicator)
+            self._state = state
         
         # Update stats text
         uptime = stats.get('uptime', 'N/A')
         pid = stats.get('pid', 'N/A')
-        self.stats_label.setText(f"Uptime: {uptime} | PID: {pid}")
+        stats_text = f"Uptime: {uptime} | PID: {pid}"
+        if stats_text != self.stats_label.text():
+            self.stats_label.setText(stats_text)
         
         # Update resource usage
         cpu = stats.get('cpu_percent', 0)
         mem = stats.get('memory_mb', 0)
-        self.resource_label.setText(f"CPU: {cpu:.1f}% | RAM: {mem:.1f} MB")
+        resource_text = f"CPU: {cpu:.1f}% | RAM: {mem:.1f} MB"
+        if resource_text != self.resource_label.text():
+            self.resource_label.setText(resource_text)
         
         # Update button states
         if not self.is_systemd:
@@ -438,41 +604,42 @@ class ServiceCard(QFrame):
             self.stop_btn.setEnabled(is_running)
     
     def start_service(self):
-        subprocess.run(['pkexec', 'systemctl', 'start', self.name], 
-                      capture_output=True, timeout=10)
+        # Detached so the polkit prompt doesn't block the event loop
+        QProcess.startDetached('pkexec', ['systemctl', 'start', self.name])
     
     def stop_service(self):
-        subprocess.run(['pkexec', 'systemctl', 'stop', self.name], 
-                      capture_output=True, timeout=10)
+        QProcess.startDetached('pkexec', ['systemctl', 'stop', self.name])
     
     def start_process(self):
         if self.name == 'librechat':
             librechat_path = Path.home() / '.local' / 'src' / 'LibreChat'
             if not librechat_path.exists():
                 QMessageBox.warning(self, "Error", "LibreChat not found at ~/.local/src/LibreChat")
-                return
+                return False
             command = ['bash', '-c', 
                       f'source ~/.nvm/nvm.sh && cd {librechat_path} && npm run backend']
-            self.process_thread = ProcessRunner(command)
+            self.process_runner = ProcessRunner(command)
             
         elif self.name == 'rag_api':
             rag_path = Path.home() / '.local' / 'src' / 'rag_api'
             if not rag_path.exists():
                 QMessageBox.warning(self, "Error", "RAG API not found at ~/.local/src/rag_api")
-                return
+                return False
             command = ['bash', '-c',
                       f'cd {rag_path} && source venv/bin/activate && uvicorn main:app --host 0.0.0.0 --port 8000']
-            self.process_thread = ProcessRunner(command)
+            self.process_runner = ProcessRunner(command)
         
-        if self.process_thread:
-            self.process_thread.output_ready.connect(self.on_log_output)
-            self.process_thread.process_started.connect(self.on_process_started)
-            self.process_thread.process_finished.connect(self.on_process_finished)
-            self.process_thread.start()
+        if self.process_runner:
+            self.process_runner.output_ready.connect(self.on_log_output)
+            self.process_runner.process_started.connect(self.on_process_started)
+            self.process_runner.process_finished.connect(self.on_process_finished)
+            self.process_runner.start()
+            return True
+        return False
     
     def on_log_output(self, text):
         """Forward log output to parent dashboard"""
-        log_text = f"[{self.display_name}] {text}"
+        log_text = ''.join(f"[{self.display_name}] {line}" for line in text.splitlines(keepends=True))
         self.log_signal.emit(log_text)
     
     def on_process_started(self):
@@ -480,21 +647,19 @@ class ServiceCard(QFrame):
         self.stop_btn.setEnabled(True)
     
     def stop_process(self):
-        if self.process_thread and self.process_thread.isRunning():
-            self.process_thread.stop_process()
-            self.process_thread.wait()
+        if self.process_runner and self.process_runner.is_running():
+            self.process_runner.stop_process()
         elif self.is_running:
             port = 3080 if self.name == 'librechat' else 8000
             try:
-                for conn in psutil.net_connections():
-                    if conn.laddr.port == port and conn.status == 'LISTEN':
-                        proc = psutil.Process(conn.pid)
-                        proc.terminate()
-                        try:
-                            proc.wait(timeout=5)
-                        except psutil.TimeoutExpired:
-                            proc.kill()
-                        break
+                conn = get_listen_map().get(port)
+                if conn and conn.pid:
+                    proc = psutil.Process(conn.pid)
+                    proc.terminate()
+                    try:
+                        proc.wait(timeout=5)
+                    except psutil.TimeoutExpired:
+                        proc.kill()
             except:
                 pass
     
@@ -512,52 +677,55 @@ class GraphWidget(QWidget):
         self.color = color
         self.max_points = 60
         self.data = deque(maxlen=self.max_points)
+        self._points = [QPointF() for _ in range(self.max_points)]
+        self._polyline = None  # Rebuilt only when data or size changes
         
         self.init_ui()
     
     def init_ui(self):
-        layout = QVBoxLayout()
-        
-        # Create chart
-        self.series = QLineSeries()
-        self.chart = QChart()
-        self.chart.addSeries(self.series)
-        self.chart.setTitle(self.title)
-        self.chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
-        self.chart.legend().hide()
-        
-        # Set axes
-        self.axis_x = QValueAxis()
-        self.axis_x.setRange(0, self.max_points)
-        self.axis_x.setLabelFormat("%d")
-        self.axis_x.setTitleText("Time (seconds)")
-        
-        self.axis_y = QValueAxis()
-        self.axis_y.setRange(0, 100)
-        self.axis_y.setLabelFormat("%.0f%%")
-        
-        self.chart.addAxis(self.axis_x, Qt.AlignmentFlag.AlignBottom)
-        self.chart.addAxis(self.axis_y, Qt.AlignmentFlag.AlignLeft)
-        self.series.attachAxis(self.axis_x)
-        self.series.attachAxis(self.axis_y)
-        
-        # Create chart view
-        from PyQt6.QtGui import QPainter
-        self.chart_view = QChartView(self.chart)
-        self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.chart_view.setMinimumHeight(200)
-        
-        layout.addWidget(self.chart_view)
-        self.setLayout(layout)
+        self.line_pen = QPen(QColor(self.color), 2)
+        self.grid_pen = QPen(QColor("#555555"), 1)
+        self.setMinimumHeight(200)
     
     def update_data(self, value):
         """Add new data point"""
         self.data.append(value)
+        self._polyline = None
+        self.update()
+    
+    def resizeEvent(self, event):
+        self._polyline = None
+        super().resizeEvent(event)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Plot area, leaving room for the title and axis labels
+        left, top = 40, 24
+        w = self.width() - left - 10
+        h = self.height() - top - 24
+        
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.drawText(QRectF(0, 0, self.width(), top), Qt.AlignmentFlag.AlignCenter, self.title)
+        painter.drawText(QRectF(0, top - 6, left - 6, 12), Qt.AlignmentFlag.AlignRight, "100%")
+        painter.drawText(QRectF(0, top + h - 6, left - 6, 12), Qt.AlignmentFlag.AlignRight, "0%")
+        
+        painter.setPen(self.grid_pen)
+        painter.drawRect(left, top, w, h)
+        
+        if len(self.data) > 1:
+            if self._polyline is None:
+                step = w / (self.max_points - 1)
+                for i, val in enumerate(self.data):
+                    self._points[i].setX(left + i * step)
+                    self._points[i].setY(top + h - val * h / 100)
+                self._polyline = QPolygonF(self._points[:len(self.data)])
+            
+            painter.setPen(self.line_pen)
+            painter.drawPolyline(self._polyline)
         
-        # Update series
-        self.series.clear()
-        for i, val in enumerate(self.data):
-            self.series.append(i, val)
+        painter.end()
 
 
 class DashboardTab(QWidget):
@@ -685,11 +853,8 @@ class MonitoringTab(QWidget):
     
     def update_graphs(self, stats):
         """Update graph data"""
-        if 'cpu_history' in stats and stats['cpu_history']:
-            self.cpu_graph.update_data(stats['cpu_history'][-1])
-        
-        if 'ram_history' in stats and stats['ram_history']:
-            self.ram_graph.update_data(stats['ram_history'][-1])
+        self.cpu_graph.update_data(stats['cpu_percent'])
+        self.ram_graph.update_data(stats['ram_percent'])
 
 
 class LogsTab(QWidget):
@@ -697,7 +862,14 @@ class LogsTab(QWidget):
     
     def __init__(self):
         super().__init__()
+        # Keep only the newest chunks if output outpaces the flush timer
+        self._buffer = deque(maxlen=1000)
         self.init_ui()
+        
+        # Flush buffered log text in batches to avoid a layout pass per line
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start(100)
     
     def init_ui(self):
         layout = QVBoxLayout()
@@ -706,10 +878,11 @@ class LogsTab(QWidget):
         label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
         layout.addWidget(label)
         
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(5000)
         self.log_output.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #d4d4d4;
                 font-family: 'Courier New', monospace;
@@ -731,10 +904,16 @@ class LogsTab(QWidget):
         self.setLayout(layout)
     
     def append_log(self, text):
-        """Append text to logs"""
-        self.log_output.moveCursor(QTextCursor.MoveOperation.End)
-        self.log_output.insertPlainText(text)
-        self.log_output.moveCursor(QTextCursor.MoveOperation.End)
+        """Queue text to be appended to logs"""
+        self._buffer.append(text)
+    
+    def _flush(self):
+        if not self._buffer:
+            return
+        # Entries are newline-terminated; appendPlainText adds its own line break
+        text = ''.join(self._buffer)
+        self._buffer.clear()
+        self.log_output.appendPlainText(text[:-1] if text.endswith('\n') else text)
 
 
 class PgAdminTab(QWidget):
@@ -743,7 +922,20 @@ class PgAdminTab(QWidget):
     def __init__(self):
         super().__init__()
         self.pgadmin_manager = None
+        self._console_buf = []
         self.init_ui()
+        
+        self._console_timer = QTimer(self)
+        self._console_timer.setSingleShot(True)
+        self._console_timer.timeout.connect(self._flush_console)
+        
+        # Readiness probe for the pgAdmin web UI, retried with backoff
+        self._network = QNetworkAccessManager(self)
+        self._probe_url = None
+        self._probe_delay = 200
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setSingleShot(True)
+        self._probe_timer.timeout.connect(self._probe_pgadmin)
     
     def init_ui(self):
         layout = QVBoxLayout()
@@ -792,22 +984,20 @@ class PgAdminTab(QWidget):
         
         layout.addLayout(status_row)
         
-        # Web view for embedded pgAdmin (much larger)
-        self.web_view = QWebEngineView()
-        self.web_view.setUrl(QUrl("about:blank"))
-        self.web_view.setMinimumHeight(600)  # Bigger minimum height
-        layout.addWidget(self.web_view, stretch=10)  # Give it most of the space
+        # Web view for embedded pgAdmin is created by init_web_view on first use
+        self.web_view = None
         
         # Console output (smaller)
         console_label = QLabel("Console:")
         console_label.setStyleSheet("font-size: 9px;")
         layout.addWidget(console_label)
         
-        self.console_output = QTextEdit()
+        self.console_output = QPlainTextEdit()
         self.console_output.setReadOnly(True)
+        self.console_output.setMaximumBlockCount(500)
         self.console_output.setMaximumHeight(100)  # Smaller console
         self.console_output.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #d4d4d4;
                 font-family: 'Courier New', monospace;
@@ -818,6 +1008,22 @@ class PgAdminTab(QWidget):
         
         self.setLayout(layout)
     
+    def init_web_view(self):
+        """Create the embedded pgAdmin browser (QtWebEngine loads Chromium, so only on demand)"""
+        if self.web_view is not None:
+            return
+        # Importing after QApplication exists relies on main() setting
+        # AA_ShareOpenGLContexts before the application is created
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        self.web_view = QWebEngineView()
+        self.web_view.setUrl(QUrl("about:blank"))
+        self.web_view.setMinimumHeight(600)  # Bigger minimum height
+        # Stay hidden until pgAdmin has rendered, avoiding a blank white page
+        self.web_view.setVisible(False)
+        self.web_view.loadFinished.connect(self._on_load_finished)
+        # Below the header and status rows; give it most of the space
+        self.layout().insertWidget(2, self.web_view, stretch=10)
+    
     def show_connection_info(self):
         """Show connection information popup"""
         info_text = """
@@ -840,24 +1046,31 @@ Password: <b>ragpassword</b></p>
     
     def start_pgadmin(self):
         """Start pgAdmin server"""
-        if self.pgadmin_manager and self.pgadmin_manager.isRunning():
+        if self.pgadmin_manager and self.pgadmin_manager.is_running():
             QMessageBox.warning(self, "Already Running", "pgAdmin is already running")
             return
         
+        # Release the previous (stopped) manager and its QProcess
+        if self.pgadmin_manager:
+            self.pgadmin_manager.status_updated.disconnect(self.on_status_updated)
+            self.pgadmin_manager.output_ready.disconnect(self.append_console)
+            self.pgadmin_manager.deleteLater()
+        
         self.pgadmin_manager = PgAdminManager()
         self.pgadmin_manager.status_updated.connect(self.on_status_updated)
         self.pgadmin_manager.output_ready.connect(self.append_console)
-        self.pgadmin_manager.start()
         
+        # start() reports a missing install synchronously via status_updated,
+        # which must be able to reset these buttons afterwards
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.append_console("Starting pgAdmin 4...\n")
+        self.pgadmin_manager.start()
     
     def stop_pgadmin(self):
         """Stop pgAdmin server"""
         if self.pgadmin_manager:
             self.pgadmin_manager.stop()
-            self.pgadmin_manager.wait()
             self.append_console("pgAdmin stopped\n")
         
         self.start_btn.setEnabled(True)
@@ -865,7 +1078,9 @@ Password: <b>ragpassword</b></p>
         self.open_browser_btn.setEnabled(False)
         self.status_label.setText("Status: Not Running")
         self.status_label.setStyleSheet("color: #888888; font-weight: bold;")
-        self.web_view.setUrl(QUrl("about:blank"))
+        if self.web_view:
+            self.web_view.setVisible(False)
+            self.web_view.setUrl(QUrl("about:blank"))
     
     def on_status_updated(self, is_running, url):
         """Handle pgAdmin status updates"""
@@ -874,64 +1089,99 @@ Password: <b>ragpassword</b></p>
             self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
             self.open_browser_btn.setEnabled(True)
             
-            # Load pgAdmin in web view
-            QTimer.singleShot(3000, lambda: self.web_view.setUrl(QUrl(url)))
+            # Load pgAdmin in web view as soon as it answers HTTP
+            self._probe_url = url
+            self._probe_delay = 200
+            self._probe_timer.start(self._probe_delay)
         else:
+            self._probe_url = None
+            self._probe_timer.stop()
             self.status_label.setText("Status: Not Running")
             self.status_label.setStyleSheet("color: #888888; font-weight: bold;")
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
             self.open_browser_btn.setEnabled(False)
     
+    def _on_load_finished(self, ok):
+        # Reveal on the first pgAdmin page; later failed loads (e.g. a
+        # cancelled navigation inside pgAdmin) must not hide it again
+        if ok and self.web_view.url().toString() != "about:blank":
+            self.web_view.setVisible(True)
+    
+    def _probe_pgadmin(self):
+        if self._probe_url:
+            reply = self._network.get(QNetworkRequest(QUrl(self._probe_url)))
+            reply.finished.connect(partial(self._on_probe_finished, reply))
+    
+    def _on_probe_finished(self, reply):
+        reply.deleteLater()
+        if not self._probe_url:
+            return
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+            self.init_web_view()
+            self.web_view.setUrl(QUrl(self._probe_url))
+            self._probe_url = None
+        else:
+            # Not up yet; back off exponentially up to 2 s between probes
+            self._probe_delay = min(self._probe_delay * 2, 2000)
+            self._probe_timer.start(self._probe_delay)
+    
     def open_in_browser(self):
         """Open pgAdmin in external browser"""
         if self.pgadmin_manager and self.pgadmin_manager.pgadmin_url:
-            try:
-                subprocess.Popen(['xdg-open', self.pgadmin_manager.pgadmin_url])
-            except:
+            if not QDesktopServices.openUrl(QUrl(self.pgadmin_manager.pgadmin_url)):
                 QMessageBox.warning(self, "Error", "Could not open browser")
     
     def append_console(self, text):
-        """Append text to console output"""
-        self.console_output.moveCursor(QTextCursor.MoveOperation.End)
-        self.console_output.insertPlainText(text)
-        self.console_output.moveCursor(QTextCursor.MoveOperation.End)
+        """Queue text for the console; bursts are flushed together after 50 ms"""
+        self._console_buf.append(text)
+        if not self._console_timer.isActive():
+            self._console_timer.start(50)
+    
+    def _flush_console(self):
+        # appendPlainText starts a new block, so hold back any partial last line
+        text = ''.join(self._console_buf)
+        end = text.rfind('\n') + 1
+        self._console_buf = [text[end:]] if end < len(text) else []
+        if end:
+            self.console_output.appendPlainText(text[:end - 1])
 
 
 class LibreChatDashboard(QMainWindow):
     """Main dashboard window"""
+    systemd_started = pyqtSignal(int)  # pkexec exit code
+    
+    _cached_icon = None
     
     def __init__(self):
         super().__init__()
-        self.system_monitor = None
-        self.service_monitor = None
+        self.monitor = None
+        self.pgadmin_tab = None
         self.init_ui()
         self.start_monitoring()
         self.connect_service_logs()
     
     def connect_service_logs(self):
         """Connect service card outputs to logs tab"""
-        for service_name, card in self.dashboard_tab.service_cards.items():
-            card.log_signal.connect(self.logs_tab.append_log)
-            
-            # Also add systemd service startup logs
-            if card.is_systemd:
-                pass  # Could fetch initial logs here if needed
+        for card in self.dashboard_tab.service_cards.values():
+            if not card._log_connected:
+                card.log_signal.connect(self.logs_tab.append_log)
+                card._log_connected = True
     
     def init_ui(self):
         self.setWindowTitle("LibreChat Dashboard")
         self.setGeometry(100, 100, 1200, 900)
         
-        # Set window icon
-        icon = QIcon.fromTheme("network-server-database")
-        if icon.isNull():
-            for fallback in ["network-server", "server-database"]:
-                icon = QIcon.fromTheme(fallback)
-                if not icon.isNull():
-                    break
-        self.setWindowIcon(icon)
-        
-        self.set_dark_theme()
+        # Set window icon (theme lookup is cached for later windows)
+        if LibreChatDashboard._cached_icon is None:
+            icon = QIcon.fromTheme("network-server-database")
+            if icon.isNull():
+                for fallback in ["network-server", "server-database"]:
+                    icon = QIcon.fromTheme(fallback)
+                    if not icon.isNull():
+                        break
+            LibreChatDashboard._cached_icon = icon
+        self.setWindowIcon(LibreChatDashboard._cached_icon)
         
         # Menu bar
         menubar = self.menuBar()
@@ -996,6 +1246,7 @@ class LibreChatDashboard(QMainWindow):
         
         self.pgadmin_tab = PgAdminTab()
         self.tabs.addTab(self.pgadmin_tab, "RAG DB Management")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         main_layout.addWidget(self.tabs)
         
@@ -1022,64 +1273,22 @@ class LibreChatDashboard(QMainWindow):
         
         central_widget.setLayout(main_layout)
     
-    def set_dark_theme(self):
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 45))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.Base, QColor(30, 30, 30))
-        palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
-        palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
-        self.setPalette(palette)
-        
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #0d47a1;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #1565c0; }
-            QPushButton:pressed { background-color: #0a3d91; }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #888888;
-            }
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 3px;
-                text-align: center;
-                background-color: #2b2b2b;
-            }
-            QProgressBar::chunk {
-                background-color: #2196F3;
-            }
-            QGroupBox {
-                border: 1px solid #555555;
-                border-radius: 5px;
-                margin-top: 10px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+    def _on_tab_changed(self, index):
+        # Only pay for QtWebEngine once the pgAdmin tab is actually opened
+        if self.tabs.widget(index) is self.pgadmin_tab:
+            self.pgadmin_tab.init_web_view()
     
     def start_monitoring(self):
-        # Start system monitor
-        self.system_monitor = SystemMonitor()
-        self.system_monitor.stats_updated.connect(self.update_system_stats)
-        self.system_monitor.start()
+        self._pending_stats = None
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.timeout.connect(self._apply_system_stats)
         
-        # Start service monitor
-        self.service_monitor = ServiceMonitor()
-        self.service_monitor.status_updated.connect(self.update_service_stats)
-        self.service_monitor.logs_ready.connect(self.populate_systemd_logs)
-        self.service_monitor.start()
+        self.monitor = MonitorController()
+        self.monitor.stats_updated.connect(self.update_system_stats)
+        self.monitor.status_updated.connect(self.update_service_stats)
+        self.monitor.logs_ready.connect(self.populate_systemd_logs)
+        self.monitor.start()
     
     def populate_systemd_logs(self, service_name, logs):
         """Add systemd logs to logs tab"""
@@ -1087,63 +1296,119 @@ class LibreChatDashboard(QMainWindow):
         self.logs_tab.append_log(formatted_logs)
     
     def update_system_stats(self, stats):
-        self.dashboard_tab.update_system_stats(stats)
-        self.monitoring_tab.update_graphs(stats)
+        # Coalesce bursts so bars and graphs repaint at most every 100 ms
+        self._pending_stats = stats
+        if not self._stats_timer.isActive():
+            self._stats_timer.start(100)
+    
+    def _apply_system_stats(self):
+        self.dashboard_tab.update_system_stats(self._pending_stats)
+        self.monitoring_tab.update_graphs(self._pending_stats)
     
     def update_service_stats(self, service_name, stats):
         self.dashboard_tab.update_service_stats(service_name, stats)
     
+    def run_pkexec(self, script, on_done, error_text):
+        """Run a bash script through pkexec without blocking the event loop"""
+        proc = QProcess(self)
+        proc.finished.connect(partial(self._on_pkexec_done, proc, on_done, error_text))
+        proc.errorOccurred.connect(partial(self._on_pkexec_error, proc, on_done, error_text))
+        
+        # Give up if the polkit prompt or systemctl takes longer than 30 s
+        kill_timer = QTimer(proc)
+        kill_timer.setSingleShot(True)
+        kill_timer.timeout.connect(proc.kill)
+        kill_timer.start(30000)
+        
+        proc.start('pkexec', ['bash', '-c', script])
+    
+    def _on_pkexec_done(self, proc, on_done, error_text, exit_code, exit_status):
+        proc.deleteLater()
+        if exit_status != QProcess.ExitStatus.NormalExit:
+            QMessageBox.critical(self, "Error", f"{error_text}: timed out")
+            exit_code = -1
+        on_done(exit_code)
+    
+    def _on_pkexec_error(self, proc, on_done, error_text, error):
+        # finished is never emitted when the process could not be started
+        if error == QProcess.ProcessError.FailedToStart:
+            proc.deleteLater()
+            QMessageBox.critical(self, "Error", f"{error_text}: {proc.errorString()}")
+            on_done(-1)
+    
     def start_systemd_services(self):
-        services = ['mongodb', 'postgresql', 'meilisearch', 'ollama']
-        try:
-            command = ['pkexec', 'bash', '-c', 
-                      ' && '.join([f'systemctl start {s}' for s in services])]
-            result = subprocess.run(command, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                QMessageBox.information(self, "Success", "Systemd services started!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to start services: {str(e)}")
+        self.run_pkexec(_START_CMD, self._on_systemd_started, "Failed to start services")
+    
+    def _on_systemd_started(self, exit_code):
+        self.systemd_started.emit(exit_code)
+        if exit_code == 0:
+            QMessageBox.information(self, "Success", "Systemd services started!")
     
     def start_everything(self):
+        connect_unique(self.systemd_started, self._start_manual_processes)
         self.start_systemd_services()
-        QTimer.singleShot(2000, self._start_manual_processes)
     
-    def _start_manual_processes(self):
-        if 'rag_api' in self.dashboard_tab.service_cards:
-            self.dashboard_tab.service_cards['rag_api'].start_process()
-        QTimer.singleShot(3000, self._start_librechat)
+    def _start_manual_processes(self, exit_code):
+        self.systemd_started.disconnect(self._start_manual_processes)
+        
+        # LibreChat and the RAG API need the databases; stop the chain if
+        # systemctl failed or the polkit prompt was dismissed
+        if exit_code != 0:
+            return
+        
+        # LibreChat needs the RAG API, so wait until it is listening
+        rag_card = self.dashboard_tab.service_cards.get('rag_api')
+        if rag_card and not rag_card.is_running and rag_card.start_process():
+            connect_unique(rag_card.running_changed, self._on_rag_api_running)
+            connect_unique(rag_card.process_runner.process_finished, self._on_rag_api_finished)
+        else:
+            self._start_librechat()
+    
+    def _stop_waiting_for_rag_api(self):
+        rag_card = self.dashboard_tab.service_cards['rag_api']
+        rag_card.running_changed.disconnect(self._on_rag_api_running)
+        rag_card.process_runner.process_finished.disconnect(self._on_rag_api_finished)
+    
+    def _on_rag_api_running(self, is_running):
+        if is_running:
+            self._stop_waiting_for_rag_api()
+            self._start_librechat()
+    
+    def _on_rag_api_finished(self, return_code):
+        # The RAG API exited before listening; its error is in the logs tab
+        self._stop_waiting_for_rag_api()
     
     def _start_librechat(self):
         if 'librechat' in self.dashboard_tab.service_cards:
             self.dashboard_tab.service_cards['librechat'].start_process()
     
     def stop_all(self):
-        reply = QMessageBox.question(
-            self, "Stop All Services?",
+        # open() shows the box without a nested event loop; the answer arrives via signal
+        box = QMessageBox(
+            QMessageBox.Icon.Question, "Stop All Services?",
             "This will gracefully stop all services.\nContinue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
+        box.buttonClicked.connect(partial(self._on_stop_confirm, box))
+        box.open()
+    
+    def _on_stop_confirm(self, box, button):
+        box.deleteLater()
+        if box.standardButton(button) == QMessageBox.StandardButton.Yes:
             for name in ['librechat', 'rag_api']:
                 if name in self.dashboard_tab.service_cards:
                     widget = self.dashboard_tab.service_cards[name]
                     if widget.is_running:
                         widget.stop_process()
             
-            services = ['ollama', 'meilisearch', 'postgresql', 'mongodb']
-            try:
-                command = ['pkexec', 'bash', '-c',
-                          ' && '.join([f'systemctl stop {s}' for s in services])]
-                subprocess.run(command, capture_output=True, text=True, timeout=30)
-                QMessageBox.information(self, "Complete", "All services stopped!")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed: {str(e)}")
+            self.run_pkexec(_STOP_CMD, self._on_systemd_stopped, "Failed")
+    
+    def _on_systemd_stopped(self, exit_code):
+        if exit_code != -1:
+            QMessageBox.information(self, "Complete", "All services stopped!")
     
     def open_librechat(self):
-        try:
-            subprocess.Popen(['xdg-open', 'http://localhost:3080'])
-        except:
+        if not QDesktopServices.openUrl(QUrl('http://localhost:3080')):
             QMessageBox.warning(self, "Error", "Could not open browser")
     
     def show_about(self):
@@ -1203,28 +1468,76 @@ class LibreChatDashboard(QMainWindow):
         msg.exec()
     
     def closeEvent(self, event):
-        if self.system_monitor:
-            self.system_monitor.stop()
-            self.system_monitor.quit()
-            self.system_monitor.wait()
-        
-        if self.service_monitor:
-            self.service_monitor.stop()
-            self.service_monitor.quit()
-            self.service_monitor.wait()
+        if self.monitor:
+            self.monitor.stop()
         
         # Stop pgAdmin if running
-        if hasattr(self, 'pgadmin_tab') and self.pgadmin_tab.pgadmin_manager:
-            if self.pgadmin_tab.pgadmin_manager.isRunning():
-                self.pgadmin_tab.pgadmin_manager.stop()
-                self.pgadmin_tab.pgadmin_manager.wait()
+        if (self.pgadmin_tab and self.pgadmin_tab.pgadmin_manager
+                and self.pgadmin_tab.pgadmin_manager.is_running()):
+            self.pgadmin_tab.pgadmin_manager.stop()
         
         event.accept()
 
 
+DARK_STYLESHEET = """
+QPushButton {
+    background-color: #0d47a1;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover { background-color: #1565c0; }
+QPushButton:pressed { background-color: #0a3d91; }
+QPushButton:disabled {
+    background-color: #555555;
+    color: #888888;
+}
+QProgressBar {
+    border: 1px solid #555555;
+    border-radius: 3px;
+    text-align: center;
+    background-color: #2b2b2b;
+}
+QProgressBar::chunk {
+    background-color: #2196F3;
+}
+QGroupBox {
+    border: 1px solid #555555;
+    border-radius: 5px;
+    margin-top: 10px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QLabel[state="run"] { color: #4CAF50; font-size: 16px; }
+QLabel[state="fail"] { color: #F44336; font-size: 16px; }
+QLabel[state="off"] { color: #9E9E9E; font-size: 16px; }
+"""
+
+
 def main():
+    # Required to import QtWebEngineWidgets after QApplication exists
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     app.setApplicationName("LibreChat Dashboard")
+    
+    # Dark theme, applied once for every window and dialog
+    app.setStyle('Fusion')
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 45))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Base, QColor(30, 30, 30))
+    palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
+    app.setPalette(palette)
+    app.setStyleSheet(DARK_STYLESHEET)
+    
     window = LibreChatDashboard()
     window.show()
     sys.exit(app.exec())